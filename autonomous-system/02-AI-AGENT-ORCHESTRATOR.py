@@ -7,7 +7,9 @@ Manages all autonomous agents for GitHub-Zapier-Jira-Notion-ClickUp integration
 import asyncio
 import json
 import logging
-from datetime import datetime
+import time
+from collections import deque
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
 import aiohttp
 import os
@@ -23,7 +25,9 @@ class AgentTask:
         self.agent_type = agent_type
         self.priority = priority
         self.status = "pending"
-        self.created_at = datetime.utcnow().isoformat()
+        # Float epoch timestamp (matches coordinator/metrics.py); format to
+        # ISO only at serialization time, not on every task creation
+        self.created_at = time.time()
         self.result = None
         self.retry_count = 0
         self.max_retries = 3
@@ -33,163 +37,347 @@ class AutonomousAgent:
     def __init__(self, agent_id: str, agent_type: str):
         self.agent_id = agent_id
         self.agent_type = agent_type
-        self.session = None
+        self.session = None  # shared ClientSession injected by the orchestrator
         self.is_running = False
 
-    async def initialize(self):
-        self.session = aiohttp.ClientSession()
+    async def initialize(self, session: aiohttp.ClientSession):
+        self.session = session
         self.is_running = True
         logger.info(f"Agent {self.agent_id} initialized")
 
     async def shutdown(self):
-        if self.session:
-            await self.session.close()
+        # The shared session is owned and closed by the orchestrator
+        self.session = None
         self.is_running = False
         logger.info(f"Agent {self.agent_id} shutdown")
 
     async def execute_task(self, task: AgentTask) -> Dict[str, Any]:
+        """Single execution attempt; raises on failure so the retry driver can back off"""
         raise NotImplementedError
 
-    async def handle_error(self, task: AgentTask, error: Exception):
-        task.retry_count += 1
-        if task.retry_count < task.max_retries:
-            logger.warning(f"Task {task.task_id} retrying... ({task.retry_count}/{task.max_retries})")
-            await asyncio.sleep(2 ** task.retry_count)
-            return await self.execute_task(task)
-        else:
-            task.status = "failed"
-            logger.error(f"Task {task.task_id} failed: {error}")
-            return {"status": "failed", "error": str(error)}
+    async def execute_with_retries(self, task: AgentTask) -> Dict[str, Any]:
+        """Iterative retry driver with capped exponential backoff.
+
+        Replaces the old recursive handle_error path, which stacked a call
+        frame per retry and slept even once attempts were exhausted.
+        """
+        last_error = None
+        for attempt in range(task.max_retries):
+            try:
+                return await self.execute_task(task)
+            except Exception as e:
+                last_error = e
+                task.retry_count = attempt + 1
+                if task.retry_count < task.max_retries:
+                    logger.warning(f"Task {task.task_id} retrying... ({task.retry_count}/{task.max_retries})")
+                    await asyncio.sleep(min(2 ** task.retry_count, 30))
+        task.status = "failed"
+        logger.error(f"Task {task.task_id} failed: {last_error}")
+        return {"status": "failed", "error": str(last_error)}
+
+class OutboundBatcher:
+    """Micro-batches outbound POSTs to a single destination URL.
+
+    Payloads are buffered and flushed as one JSON-array POST when the buffer
+    reaches max_batch or flush_interval_s elapses, whichever comes first.
+    Each submit() resolves once its batch has been delivered.
+    """
+    def __init__(self, session: aiohttp.ClientSession, url: str,
+                 headers: Optional[Dict[str, str]] = None,
+                 max_batch: int = 32, flush_interval_s: float = 0.05):
+        self.session = session
+        self.url = url
+        self.headers = headers or {"Content-Type": "application/json"}
+        self.max_batch = max_batch
+        self.flush_interval_s = flush_interval_s
+        self._pending = deque()
+        self._wakeup = asyncio.Event()
+        self._flusher = None
+
+    def start(self):
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(self._flush_loop())
+
+    async def stop(self):
+        if self._flusher:
+            self._flusher.cancel()
+            await asyncio.gather(self._flusher, return_exceptions=True)
+            self._flusher = None
+        if self._pending:
+            await self._flush()
+
+    async def submit(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((payload, future))
+        if len(self._pending) >= self.max_batch:
+            self._wakeup.set()
+        return await future
+
+    async def _flush_loop(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval_s)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            if self._pending:
+                await self._flush()
+
+    def _build_body(self, payloads: List[Dict[str, Any]]) -> Any:
+        """Request body for one batch; the default is a bare JSON array."""
+        return payloads
+
+    async def _read_body(self, response: aiohttp.ClientResponse) -> Any:
+        """Response body for _resolve_batch; unused by the default resolver."""
+        return None
+
+    def _resolve_batch(self, batch, status: int, body: Any):
+        """Settle every future in the batch from the response."""
+        for _, future in batch:
+            if future.done():
+                continue
+            if status in [200, 201]:
+                future.set_result({"status": "success"})
+            else:
+                future.set_exception(Exception(f"Batch POST failed: {status}"))
+
+    async def _flush(self):
+        batch = list(self._pending)
+        self._pending.clear()
+        payloads = [payload for payload, _ in batch]
+        try:
+            async with self.session.post(
+                self.url, json=self._build_body(payloads), headers=self.headers
+            ) as response:
+                status = response.status
+                body = await self._read_body(response)
+            self._resolve_batch(batch, status, body)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+class JiraBulkBatcher(OutboundBatcher):
+    """Batches issue creates through Jira's bulk endpoint.
+
+    POST /rest/api/2/issue/bulk expects {"issueUpdates": [...]} — the
+    single-issue endpoint rejects arrays — and reports per-item failures
+    by index, so each submit() resolves with its own outcome.
+    """
+    def _build_body(self, payloads: List[Dict[str, Any]]) -> Any:
+        return {"issueUpdates": payloads}
+
+    async def _read_body(self, response: aiohttp.ClientResponse) -> Any:
+        try:
+            return await response.json(content_type=None)
+        except Exception:
+            return None
+
+    def _resolve_batch(self, batch, status: int, body: Any):
+        if status not in [200, 201] or not isinstance(body, dict):
+            super()._resolve_batch(batch, status, body)
+            return
+        failures = {}
+        for error in body.get("errors", []):
+            index = error.get("failedElementNumber")
+            if index is not None:
+                failures[index] = error.get("elementErrors", error)
+        created = iter(body.get("issues", []))
+        for index, (_, future) in enumerate(batch):
+            if future.done():
+                continue
+            if index in failures:
+                future.set_exception(Exception(f"Jira bulk create failed: {failures[index]}"))
+            else:
+                future.set_result({"status": "success", "issue": next(created, None)})
 
 class GitHubWebhookAgent(AutonomousAgent):
     def __init__(self):
         super().__init__("github-webhook-agent", "webhook")
         self.zapier_webhook = os.getenv("ZAPIER_WEBHOOK_URL")
+        self.batcher = None
+
+    async def initialize(self, session: aiohttp.ClientSession):
+        await super().initialize(session)
+        self.batcher = OutboundBatcher(session, self.zapier_webhook)
+        self.batcher.start()
+
+    async def shutdown(self):
+        if self.batcher:
+            await self.batcher.stop()
+        await super().shutdown()
 
     async def execute_task(self, task: AgentTask) -> Dict[str, Any]:
-        try:
-            task.status = "in_progress"
-            async with self.session.post(
-                self.zapier_webhook,
-                json=task.result or {},
-                headers={"Content-Type": "application/json"}
-            ) as response:
-                if response.status in [200, 201]:
-                    task.status = "completed"
-                    logger.info(f"GitHub webhook processed: {task.task_id}")
-                    return {"status": "success"}
-                else:
-                    raise Exception(f"Zapier webhook failed: {response.status}")
-        except Exception as e:
-            return await self.handle_error(task, e)
+        task.status = "in_progress"
+        result = await self.batcher.submit(task.result or {})
+        task.status = "completed"
+        logger.info(f"GitHub webhook processed: {task.task_id}")
+        return result
 
 class JiraIntegrationAgent(AutonomousAgent):
     def __init__(self):
         super().__init__("jira-agent", "jira")
         self.jira_url = os.getenv("JIRA_API_URL")
         self.jira_token = os.getenv("JIRA_TOKEN")
+        self.issue_batcher = None
 
-    async def execute_task(self, task: AgentTask) -> Dict[str, Any]:
-        try:
-            task.status = "in_progress"
-            headers = {
+    async def initialize(self, session: aiohttp.ClientSession):
+        await super().initialize(session)
+        self.issue_batcher = JiraBulkBatcher(
+            session,
+            f"{self.jira_url}/rest/api/2/issue/bulk",
+            headers={
                 "Authorization": f"Bearer {self.jira_token}",
                 "Content-Type": "application/json"
             }
-            operation = task.result.get("operation") if task.result else None
-            if operation == "create_issue":
-                async with self.session.post(
-                    f"{self.jira_url}/rest/api/2/issue",
-                    json=task.result.get("data"),
-                    headers=headers
-                ) as response:
-                    if response.status in [200, 201]:
-                        task.status = "completed"
-                        logger.info(f"Jira issue created")
-                        return {"status": "success"}
-                    else:
-                        raise Exception(f"Jira error: {response.status}")
-        except Exception as e:
-            return await self.handle_error(task, e)
+        )
+        self.issue_batcher.start()
+
+    async def shutdown(self):
+        if self.issue_batcher:
+            await self.issue_batcher.stop()
+        await super().shutdown()
+
+    async def execute_task(self, task: AgentTask) -> Dict[str, Any]:
+        task.status = "in_progress"
+        operation = task.result.get("operation") if task.result else None
+        if operation == "create_issue":
+            result = await self.issue_batcher.submit(task.result.get("data"))
+            task.status = "completed"
+            logger.info(f"Jira issue created")
+            return result
+        task.status = "completed"
+        return {"status": "skipped", "operation": operation}
 
 class MonitoringAgent(AutonomousAgent):
-    def __init__(self):
+    def __init__(self, agent_count: int = 0):
         super().__init__("monitoring-agent", "monitor")
         self.metrics = {}
+        # Static health-check fields built once; each tick only copies the
+        # template and stamps the timestamp
+        self._metrics_template = {
+            "status": "operational",
+            "active_agents": agent_count
+        }
 
     async def execute_task(self, task: AgentTask) -> Dict[str, Any]:
-        try:
-            task.status = "in_progress"
-            metrics = {
-                "timestamp": datetime.utcnow().isoformat(),
-                "status": "operational",
-                "active_agents": 4
-            }
-            task.status = "completed"
-            logger.info("Health check: operational")
-            return {"status": "success", "metrics": metrics}
-        except Exception as e:
-            return await self.handle_error(task, e)
+        task.status = "in_progress"
+        metrics = self._metrics_template.copy()
+        metrics["timestamp"] = time.time()
+        task.status = "completed"
+        logger.info("Health check: operational")
+        return {"status": "success", "metrics": metrics}
+
+AGENT_ROUTING = {
+    "webhook": "GitHubWebhookAgent",
+    "jira": "JiraIntegrationAgent",
+    "monitor": "MonitoringAgent"
+}
+
+@lru_cache(maxsize=256)
+def _route_task(agent_type: str, priority: int) -> tuple:
+    """Cached routing decision keyed by (agent_type, priority)"""
+    return (AGENT_ROUTING.get(agent_type, "AutonomousAgent"), priority)
 
 class DecisionEngine:
     """AI-powered routing and optimization engine"""
     def analyze_task(self, task: AgentTask) -> Dict[str, Any]:
-        routing = {
-            "webhook": "GitHubWebhookAgent",
-            "jira": "JiraIntegrationAgent",
-            "monitor": "MonitoringAgent"
-        }
-        agent_type = routing.get(task.agent_type, "AutonomousAgent")
-        return {"agent_type": agent_type, "priority": task.priority}
+        agent_type, priority = _route_task(task.agent_type, task.priority)
+        return {"agent_type": agent_type, "priority": priority}
 
 class AutonomousOrchestrator:
     """Master orchestrator for all autonomous agents - ZERO HUMAN INTERVENTION"""
-    def __init__(self):
+    def __init__(self, num_workers: int = 8, queue_maxsize: int = 1024):
         self.agents = {}
-        self.task_queue = asyncio.Queue()
-        self.completed_tasks = []
+        self.agents_by_type = {}
+        # Bounded queue: when full, enqueue_task blocks and producers
+        # naturally back off instead of growing memory without limit
+        self.task_queue = asyncio.Queue(maxsize=queue_maxsize)
+        # Bounded history: old AgentTask objects (and their result payloads)
+        # are evicted instead of accumulating for the process lifetime
+        self.completed_tasks = deque(maxlen=10_000)
+        self.completed_count = 0
         self.decision_engine = DecisionEngine()
+        self.session = None
+        self.num_workers = num_workers
+        self.workers = []
         self.is_running = False
 
     async def initialize(self):
+        # One pooled session shared by all agents: keep-alive connections
+        # to Zapier/Jira are reused instead of a TLS handshake per agent
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=30,
+                ttl_dns_cache=300,
+                keepalive_timeout=75
+            )
+        )
         agent_classes = [
             GitHubWebhookAgent(),
-            JiraIntegrationAgent(),
-            MonitoringAgent()
+            JiraIntegrationAgent()
         ]
+        # Monitor reports the real roster size (including itself) instead
+        # of a hard-coded count
+        agent_classes.append(MonitoringAgent(agent_count=len(agent_classes) + 1))
         for agent in agent_classes:
-            await agent.initialize()
+            await agent.initialize(self.session)
             self.agents[agent.agent_id] = agent
+            self.agents_by_type[agent.agent_type] = agent
         self.is_running = True
         logger.info(f"✓ Orchestrator initialized with {len(self.agents)} agents - AUTONOMOUS MODE ACTIVE")
 
     async def shutdown(self):
         self.is_running = False
+        for worker in self.workers:
+            worker.cancel()
+        if self.workers:
+            await asyncio.gather(*self.workers, return_exceptions=True)
+            self.workers = []
         for agent in self.agents.values():
             await agent.shutdown()
+        if self.session:
+            await self.session.close()
+            self.session = None
         logger.info("✓ Orchestrator shutdown complete")
 
     async def enqueue_task(self, task: AgentTask):
+        # Awaits when the queue is full, applying backpressure to the caller
         await self.task_queue.put(task)
         logger.info(f"✓ Task enqueued: {task.task_id}")
 
-    async def process_tasks(self):
+    async def _dispatch(self, task: AgentTask):
+        agent = self.agents_by_type.get(task.agent_type)
+        if agent:
+            result = await agent.execute_with_retries(task)
+            task.result = result
+            self.completed_tasks.append(task)
+            self.completed_count += 1
+            logger.info(f"✓ Task completed: {task.task_id}")
+        else:
+            logger.warning(f"No agent registered for type: {task.agent_type}")
+
+    async def _worker(self):
+        """Single consumer loop; N of these run concurrently so HTTP latency overlaps"""
         while self.is_running:
             try:
                 task = await asyncio.wait_for(self.task_queue.get(), timeout=5.0)
-                decision = self.decision_engine.analyze_task(task)
-                for agent in self.agents.values():
-                    if agent.agent_type == task.agent_type:
-                        result = await agent.execute_task(task)
-                        task.result = result
-                        self.completed_tasks.append(task)
-                        logger.info(f"✓ Task completed: {task.task_id}")
-                        break
-                self.task_queue.task_done()
             except asyncio.TimeoutError:
                 continue
+            try:
+                await self._dispatch(task)
             except Exception as e:
                 logger.error(f"Error processing task: {e}")
+            finally:
+                self.task_queue.task_done()
+
+    async def process_tasks(self):
+        self.workers = [
+            asyncio.create_task(self._worker())
+            for _ in range(self.num_workers)
+        ]
+        await asyncio.gather(*self.workers, return_exceptions=True)
 
     async def run(self):
         await self.initialize()
@@ -1,7 +1,7 @@
 """Agent factory for creating and managing orchestrated agents."""
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Dict, Any, Optional, Callable, Awaitable
+from typing import Dict, Any, Optional, Callable, Awaitable, Tuple
 import asyncio
 from dataclasses import dataclass
 from job_context import JobContext
@@ -130,15 +130,39 @@ class AgentFactory:
         AgentType.DRAFTER: DrafterAgent,
         AgentType.VALIDATOR: ValidatorAgent,
     }
-    
+
+    # Idle instances keyed by config; only agents explicitly handed back
+    # via release_agent land here, so an in-use instance is never pooled
+    _idle_pool: Dict[Tuple[AgentType, str, float], list] = {}
+
     @classmethod
     def create_agent(cls, agent_id: str, agent_type: AgentType, role: str, timeout: float = 30.0) -> BaseAgent:
-        """Create an agent instance."""
+        """Create an agent instance, reusing released instances of the same config."""
         agent_class = cls._agent_classes.get(agent_type)
         if not agent_class:
             raise ValueError(f"Unknown agent type: {agent_type}")
+
+        pool = cls._idle_pool.get((agent_type, role, timeout))
+        if pool:
+            agent = pool.pop()
+            # Reset per-run mutable state so the reused instance starts fresh
+            agent.agent_id = agent_id
+            agent.state = AgentState.PENDING
+            agent.result = None
+            agent.error = None
+            return agent
         return agent_class(agent_id, agent_type, role, timeout)
-    
+
+    @classmethod
+    def release_agent(cls, agent: BaseAgent):
+        """Return a finished agent to the pool for reuse by create_agent."""
+        cls._idle_pool.setdefault((agent.agent_type, agent.role, agent.timeout), []).append(agent)
+
+    @classmethod
+    def clear_cache(cls):
+        """Drop all pooled agent instances."""
+        cls._idle_pool.clear()
+
     @classmethod
     def register_agent_type(cls, agent_type: AgentType, agent_class: type):
         """Register a custom agent type."""
@@ -28,47 +28,55 @@ class JobCoordinator:
     def __init__(self, job_context: JobContext):
         self.global_state = job_context
         self.agents: Dict[str, AgentTask] = {}
-        self.metrics: Dict[str, Dict[str, Any]] = {}
-    
+        # Registration-ordered (name, task) pairs so execute_parallel
+        # iterates once without rebuilding parallel lists per job
+        self._agent_order: List[tuple] = []
+
     def register_agent(self, agent_task: AgentTask):
         """Register an agent for execution"""
+        if agent_task.name in self.agents:
+            self._agent_order = [
+                entry for entry in self._agent_order if entry[0] != agent_task.name
+            ]
         self.agents[agent_task.name] = agent_task
-        self.metrics[agent_task.name] = {
-            'attempts': 0,
-            'total_latency_ms': 0,
-            'max_latency_ms': 0
-        }
+        self._agent_order.append((agent_task.name, agent_task))
     
     async def execute_parallel(self) -> Dict[str, Any]:
         """
-        Execute all registered agents in parallel using asyncio.gather.
+        Execute all registered agents in parallel.
         Each agent receives role-filtered context from global_state.
+        Results are merged in completion order (FIRST_COMPLETED draining),
+        so a fast collector publishes its artifacts to the blackboard
+        while a slow validator is still running.
         """
         logger.info(f"Starting parallel execution for job {self.global_state.job_id}")
-        
-        tasks = []
-        agent_names = []
-        
-        for agent_name, agent_task in self.agents.items():
-            agent_names.append(agent_name)
-            # Get role-filtered context for this agent
-            agent_context = self.global_state.get_agent_context(agent_name)
-            
-            # Wrap agent call with retry & timeout logic
-            task = self._run_agent_with_resilience(
-                agent_name,
-                agent_task,
-                agent_context
+
+        # Wrap each agent call with retry & timeout logic, handing it a
+        # role-filtered context view. Task names carry the agent name
+        # through to the merge step.
+        pending = {
+            asyncio.create_task(
+                self._run_agent_with_resilience(
+                    agent_name,
+                    agent_task,
+                    self.global_state.get_agent_context(agent_name)
+                ),
+                name=agent_name
             )
-            tasks.append(task)
-        
-        # Run all agents concurrently
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Merge results back into global state
-        self._merge_results(agent_names, results)
-        
-        logger.info(f"Parallel execution completed. Job state: {self.global_state.to_dict()}")
+            for agent_name, agent_task in self._agent_order
+        }
+
+        # Drain in completion order: each finished agent is merged into
+        # global state immediately. _run_agent_with_resilience reports
+        # failures as result dicts rather than raising.
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                self._merge_single(task.get_name(), task.result())
+
+        # Log lazily by job id only — serializing the whole state dict per
+        # job is wasted work when INFO logging is suppressed
+        logger.info("Parallel execution completed for job %s", self.global_state.job_id)
         return self.global_state.to_dict()
     
     async def _run_agent_with_resilience(
@@ -79,33 +87,28 @@ class JobCoordinator:
     ) -> Dict[str, Any]:
         """
         Execute single agent with retry logic & timeout.
+        Timing lands directly on the agent's AgentState — the single
+        source of truth for per-job metrics.
         """
-        self.global_state.agent_state[agent_name].status = AgentStatus.ACTIVE
+        state = self.global_state.agent_state[agent_name]
+        state.status = AgentStatus.ACTIVE
+        state.timestamp_start = time.time()
         
         for attempt in range(agent_task.max_retries):
             try:
-                self.metrics[agent_name]['attempts'] += 1
-                
-                start_time = time.time()
                 result = await asyncio.wait_for(
                     agent_task.agent_func(agent_context, self.global_state),
                     timeout=agent_task.timeout_sec
                 )
-                latency_ms = (time.time() - start_time) * 1000
+                state.timestamp_end = time.time()
                 
-                # Track metrics
-                self.metrics[agent_name]['total_latency_ms'] += latency_ms
-                self.metrics[agent_name]['max_latency_ms'] = max(
-                    self.metrics[agent_name]['max_latency_ms'],
-                    latency_ms
-                )
-                
-                logger.info(f"{agent_name} completed in {latency_ms:.2f}ms")
+                logger.info(f"{agent_name} completed in {state.latency_ms:.2f}ms")
                 return {'agent': agent_name, 'result': result, 'error': None}
             
             except asyncio.TimeoutError:
                 logger.error(f"{agent_name} timed out after {agent_task.timeout_sec}s (attempt {attempt+1})")
                 if attempt == agent_task.max_retries - 1:
+                    state.timestamp_end = time.time()
                     self.global_state.update_agent_state(
                         agent_name,
                         AgentStatus.TIMEOUT,
@@ -117,6 +120,7 @@ class JobCoordinator:
             except Exception as e:
                 logger.error(f"{agent_name} failed: {str(e)} (attempt {attempt+1})")
                 if attempt == agent_task.max_retries - 1:
+                    state.timestamp_end = time.time()
                     self.global_state.update_agent_state(
                         agent_name,
                         AgentStatus.FAILED,
@@ -125,31 +129,38 @@ class JobCoordinator:
                     return {'agent': agent_name, 'result': None, 'error': str(e)}
                 await asyncio.sleep(0.5 * (2 ** attempt))
     
-    def _merge_results(self, agent_names: List[str], results: List[Dict[str, Any]]):
+    def _merge_single(self, agent_name: str, result: Dict[str, Any]):
         """
-        Sync agent results back to global state (blackboard pattern).
+        Sync one agent's result back to global state (blackboard pattern).
+        Called per completed agent so downstream readers see artifacts as
+        soon as their producer finishes.
         """
-        for agent_name, result in zip(agent_names, results):
-            if isinstance(result, Exception):
-                logger.error(f"Agent {agent_name} raised: {result}")
-                self.global_state.update_agent_state(agent_name, AgentStatus.FAILED, error=str(result))
-            elif result.get('error'):
-                logger.warning(f"Agent {agent_name} returned error: {result['error']}")
-                self.global_state.update_agent_state(agent_name, AgentStatus.FAILED, error=result['error'])
-            else:
-                logger.info(f"Agent {agent_name} succeeded")
-                self.global_state.update_agent_state(
-                    agent_name,
-                    AgentStatus.COMPLETED,
-                    result=result.get('result')
-                )
-                # Merge artifacts if agent returned them
-                if result.get('result') and 'artifacts' in result['result']:
-                    self.global_state.artifacts.update(result['result']['artifacts'])
+        state = self.global_state.agent_state.get(agent_name)
+        if state is None:
+            return
+        if result.get('error'):
+            logger.warning(f"Agent {agent_name} returned error: {result['error']}")
+            state.status = AgentStatus.FAILED
+            state.error = result['error']
+        else:
+            logger.info(f"Agent {agent_name} succeeded")
+            agent_result = result.get('result')
+            state.status = AgentStatus.COMPLETED
+            state.result = agent_result
+            # Merge artifacts if agent returned them
+            if agent_result and 'artifacts' in agent_result:
+                self.global_state.artifacts.update(agent_result['artifacts'])
     
     def get_metrics(self) -> Dict[str, Any]:
-        """Return aggregated metrics for all agents"""
+        """Return aggregated metrics for all agents, derived from agent state"""
         return {
-            'agents': self.metrics,
+            'agents': {
+                name: {
+                    'status': state.status.value,
+                    'latency_ms': state.latency_ms,
+                    'error': state.error
+                }
+                for name, state in self.global_state.agent_state.items()
+            },
             'global_state': self.global_state.to_dict()
         }
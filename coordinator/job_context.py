@@ -1,7 +1,8 @@
+import time
+from collections.abc import Mapping
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional
+from typing import ClassVar, Dict, List, Any, Optional, Tuple
 from enum import Enum
-from datetime import datetime
 
 class AgentStatus(Enum):
     """Agent execution status"""
@@ -28,6 +29,32 @@ class AgentState:
             return (self.timestamp_end - self.timestamp_start) * 1000
         return 0.0
 
+class _RoleContextView(Mapping):
+    """Read-only mapping over a role's slice of a JobContext.
+
+    Agents read the shared context through this view instead of a copied
+    dict — no per-agent dict build, and accidental writes raise TypeError.
+    """
+    __slots__ = ('_ctx', '_keys')
+
+    def __init__(self, ctx: 'JobContext', keys: Tuple[str, ...]):
+        self._ctx = ctx
+        self._keys = keys
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._keys:
+            raise KeyError(key)
+        return self._ctx.__dict__[key]
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        return f"_RoleContextView({dict(self)!r})"
+
 @dataclass
 class JobContext:
     """
@@ -40,8 +67,17 @@ class JobContext:
     constraints: List[str] = field(default_factory=list)
     decisions: List[Dict[str, Any]] = field(default_factory=list)
     agent_state: Dict[str, AgentState] = field(default_factory=dict)
-    timestamp_created: float = field(default_factory=lambda: datetime.now().timestamp())
-    
+    timestamp_created: float = field(default_factory=time.time)
+
+    # Role -> context fields each agent may read. Class-level and immutable
+    # so get_agent_context allocates nothing per call.
+    _ROLE_FILTERS: ClassVar[Dict[str, Tuple[str, ...]]] = {
+        'collector': ('task', 'constraints'),
+        'drafter': ('task', 'artifacts', 'decisions', 'constraints'),
+        'validator': ('task', 'artifacts', 'constraints')
+    }
+
+
     def __post_init__(self):
         """Initialize agent states"""
         if not self.agent_state:
@@ -51,29 +87,23 @@ class JobContext:
                 'validator': AgentState(name='validator')
             }
     
-    def get_agent_context(self, role: str) -> Dict[str, Any]:
+    def get_agent_context(self, role: str) -> Mapping:
         """
         Role-based context filtering.
-        Each agent gets only relevant context fields.
+        Each agent gets a read-only view of its relevant context fields;
+        values are live references to the shared store, not snapshots.
         """
-        filters = {
-            'collector': ['task', 'constraints'],
-            'drafter': ['task', 'artifacts', 'decisions', 'constraints'],
-            'validator': ['task', 'artifacts', 'constraints']
-        }
-        
-        relevant_keys = filters.get(role, [])
-        return {k: getattr(self, k) for k in relevant_keys if hasattr(self, k)}
+        return _RoleContextView(self, self._ROLE_FILTERS.get(role, ()))
     
-    def update_agent_state(self, agent_name: str, status: AgentStatus, 
+    def update_agent_state(self, agent_name: str, status: AgentStatus,
                           result: Optional[Dict] = None, error: Optional[str] = None):
         """Update agent state in global context"""
-        if agent_name in self.agent_state:
-            self.agent_state[agent_name].status = status
-            if result:
-                self.agent_state[agent_name].result = result
-            if error:
-                self.agent_state[agent_name].error = error
+        state = self.agent_state.get(agent_name)
+        if state is None:
+            return
+        state.status = status
+        state.result = result or state.result
+        state.error = error or state.error
     
     def to_dict(self) -> Dict[str, Any]:
         """Serialize context to dict"""
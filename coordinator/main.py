@@ -3,30 +3,39 @@ import asyncio
 import sys
 from typing import Dict, Any
 
-from orchestration_runner import civic_orchestrator
+from orchestration_runner import CivicOrchestrator
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 class MultiProjectExecutor:
     async def run_all_projects(self) -> Dict[str, Any]:
         import time
         start = time.time()
-        
-        civic_job = {"job_id": "civic-001", "description": "Data orchestration"}
-        mfo_job = {"job_id": "mfo-001", "description": "Risk assessment"}
-        bakhmach_job = {"job_id": "bakhmach-001", "description": "Heatmap generation"}
-        cosmic_job = {"job_id": "cosmic-001", "description": "Metrics monitoring"}
-        
-        # Execute all 4 orchestrators in parallel via asyncio.gather
+
+        jobs = {
+            "civic": {"id": "civic-001", "task": {"description": "Data orchestration"}},
+            "mfo": {"id": "mfo-001", "task": {"description": "Risk assessment"}},
+            "bakhmach": {"id": "bakhmach-001", "task": {"description": "Heatmap generation"}},
+            "cosmic": {"id": "cosmic-001", "task": {"description": "Metrics monitoring"}},
+        }
+
+        # One orchestrator per project; all 4 runs actually scheduled and
+        # gathered, with results mapped back by gather's input order
+        orchestrators = {name: CivicOrchestrator() for name in jobs}
         results = await asyncio.gather(
-            civic_orchestrator.run(civic_job),
+            *(orchestrators[name].run(job) for name, job in jobs.items()),
             return_exceptions=True
         )
-        
+
         duration = time.time() - start
         return {
             "status": "completed",
             "duration_ms": round(duration * 1000),
-            "projects": 4,
-            "results": {"civic": results[0] if results else {}}
+            "projects": len(jobs),
+            "results": dict(zip(jobs, results))
         }
 
 async def main():
@@ -46,5 +55,7 @@ async def main():
     return result
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        uvloop.install()
     result = asyncio.run(main())
     sys.exit(0 if result['status'] == 'completed' else 1)
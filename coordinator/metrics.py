@@ -6,6 +6,14 @@ from enum import Enum
 import json
 from datetime import datetime
 
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
 
 class MetricType(Enum):
     """Metric types for agent execution."""
@@ -63,59 +71,82 @@ class MetricsCollector:
         self.job_metrics: Dict[str, Any] = {}
         self.start_time = time.time()
         self.end_time: Optional[float] = None
-    
+        # Running totals maintained incrementally so dashboard queries
+        # are O(1) instead of re-scanning every agent
+        self._totals = {
+            'errors': 0,
+            'retries': 0,
+            'timeouts': 0,
+            'success': 0,
+            'failure': 0,
+        }
+
     def start_agent(self, agent_id: str) -> AgentMetrics:
         """Record the start of an agent execution."""
+        prior = self.agent_metrics.get(agent_id)
+        if prior is not None:
+            # Re-registering replaces the entry, so back out the prior
+            # run's contribution to keep the running totals consistent
+            # with the per-agent detail list
+            self._totals['errors'] -= prior.error_count
+            self._totals['retries'] -= prior.retry_count
+            self._totals['timeouts'] -= prior.timeout_count
+            if prior.end_time is not None:
+                self._totals['success' if prior.success else 'failure'] -= 1
         metrics = AgentMetrics(agent_id=agent_id)
         self.agent_metrics[agent_id] = metrics
         return metrics
-    
+
     def record_error(self, agent_id: str, error_msg: str, is_timeout: bool = False):
         """Record an error for an agent."""
         if agent_id in self.agent_metrics:
             metrics = self.agent_metrics[agent_id]
             metrics.error_count += 1
+            self._totals['errors'] += 1
             if is_timeout:
                 metrics.timeout_count += 1
-    
+                self._totals['timeouts'] += 1
+
     def record_retry(self, agent_id: str):
         """Record a retry attempt for an agent."""
         if agent_id in self.agent_metrics:
             self.agent_metrics[agent_id].retry_count += 1
-    
+            self._totals['retries'] += 1
+
     def end_agent(self, agent_id: str, success: bool, error_msg: Optional[str] = None, result: Optional[Dict] = None):
         """Record the completion of an agent execution."""
         if agent_id in self.agent_metrics:
             metrics = self.agent_metrics[agent_id]
             metrics.mark_complete(success, error_msg)
             metrics.result = result
-    
-    def get_dashboard_data(self) -> Dict[str, Any]:
-        """Get current metrics dashboard data."""
+            self._totals['success' if success else 'failure'] += 1
+
+    def get_dashboard_data(self, detail: bool = True) -> Dict[str, Any]:
+        """Get current metrics dashboard data.
+
+        Aggregates come from the running totals; pass detail=False to skip
+        the per-agent list and keep the query O(1).
+        """
         self.end_time = time.time()
         total_duration = self.end_time - self.start_time
-        
-        agent_list = [m.to_dict() for m in self.agent_metrics.values()]
-        successful = sum(1 for m in self.agent_metrics.values() if m.success)
-        failed = len(self.agent_metrics) - successful
-        
+
         return {
             "timestamp": datetime.now().isoformat(),
             "total_duration_ms": round(total_duration * 1000),
             "total_agents": len(self.agent_metrics),
-            "successful_agents": successful,
-            "failed_agents": failed,
-            "agents": agent_list,
+            "successful_agents": self._totals['success'],
+            "failed_agents": self._totals['failure'],
+            "agents": [m.to_dict() for m in self.agent_metrics.values()] if detail else [],
             "summary": {
-                "total_errors": sum(m.error_count for m in self.agent_metrics.values()),
-                "total_retries": sum(m.retry_count for m in self.agent_metrics.values()),
-                "total_timeouts": sum(m.timeout_count for m in self.agent_metrics.values()),
+                "total_errors": self._totals['errors'],
+                "total_retries": self._totals['retries'],
+                "total_timeouts": self._totals['timeouts'],
             }
         }
-    
+
     def to_json(self) -> str:
-        """Export metrics as JSON."""
-        return json.dumps(self.get_dashboard_data(), indent=2)
+        """Export metrics as JSON (orjson when available)."""
+        return _dumps(self.get_dashboard_data())
 
 
 # Global metrics instance
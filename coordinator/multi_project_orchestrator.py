@@ -1,5 +1,6 @@
 """Multi-project orchestrator for parallel execution across all projects."""
 import asyncio
+import sys
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 from datetime import datetime
@@ -21,9 +22,10 @@ class ProjectJobSpec:
 class MultiProjectOrchestrator:
     """Master orchestrator for running multiple project orchestrators in parallel."""
     
-    def __init__(self):
+    def __init__(self, max_concurrency: int = 32):
         self.projects: Dict[str, Any] = {}
         self.project_results: Dict[str, Any] = {}
+        self.max_concurrency = max_concurrency
         self.start_time: Optional[float] = None
         self.end_time: Optional[float] = None
         self.execution_report: Dict[str, Any] = {}
@@ -43,36 +45,55 @@ class MultiProjectOrchestrator:
         """
         import time
         self.start_time = time.time()
-        
-        # Create tasks for all projects
-        tasks = []
-        task_to_project = {}
-        
-        for project_id, job_spec in job_specs.items():
-            if project_id not in self.projects:
-                print(f"Warning: Project {project_id} not registered")
-                continue
-            
-            orchestrator = self.projects[project_id]
-            # Prepare job spec as dict for orchestrator
+
+        # Cap in-flight project runs so large job batches don't spike
+        # memory or thrash downstream connectors
+        sem = asyncio.Semaphore(self.max_concurrency)
+
+        async def _run_one(orchestrator, job_spec: ProjectJobSpec):
             job_dict = {
                 "job_id": job_spec.job_id,
                 "description": job_spec.description,
                 "agents": job_spec.agents,
             }
-            
-            task = asyncio.create_task(orchestrator.run(job_dict))
-            tasks.append(task)
-            task_to_project[id(task)] = project_id
-        
-        # Execute all projects in parallel
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Map results back to projects
-        for i, task in enumerate(tasks):
-            project_id = task_to_project.get(id(task))
-            result = results[i]
-            
+            async with sem:
+                return await orchestrator.run(job_dict)
+
+        async def _run_guarded(orchestrator, job_spec: ProjectJobSpec):
+            # Return the exception instead of raising so one failed
+            # project neither cancels its siblings nor aborts the batch
+            try:
+                return await _run_one(orchestrator, job_spec)
+            except Exception as exc:
+                return exc
+
+        runnable = []
+        project_ids: List[str] = []
+        for project_id, job_spec in job_specs.items():
+            if project_id not in self.projects:
+                print(f"Warning: Project {project_id} not registered")
+                continue
+            runnable.append((project_id, job_spec))
+            project_ids.append(project_id)
+
+        # Run all projects in parallel; both paths preserve input order,
+        # so the parallel id list maps results back. TaskGroup (3.11+)
+        # has a faster scheduling path and structured cancellation.
+        if sys.version_info >= (3, 11):
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(_run_guarded(self.projects[project_id], job_spec))
+                    for project_id, job_spec in runnable
+                ]
+            results = [task.result() for task in tasks]
+        else:
+            results = await asyncio.gather(
+                *(_run_guarded(self.projects[project_id], job_spec)
+                  for project_id, job_spec in runnable)
+            )
+
+        # Map results back to projects positionally
+        for project_id, result in zip(project_ids, results):
             if isinstance(result, Exception):
                 self.project_results[project_id] = {
                     "status": "failed",
@@ -87,8 +108,6 @@ class MultiProjectOrchestrator:
     
     def _generate_report(self) -> Dict[str, Any]:
         """Generate aggregated execution report."""
-        from metrics import global_metrics
-        
         if self.start_time and self.end_time:
             total_duration = self.end_time - self.start_time
         else:
@@ -4,10 +4,14 @@ Integrates JobCoordinator with existing agent pipeline for parallel execution.
 """
 
 import asyncio
-import time
 from typing import Dict, Any, Optional
 from coordinator import JobCoordinator, JobContext, AgentStatus
-from coordinator.metrics import global_metrics, AgentMetrics
+from coordinator.metrics import global_metrics
+
+try:
+    import uvloop  # libuv event loop: C-level task dispatch when installed
+except ImportError:
+    uvloop = None
 
 class CivicOrchestrator:
     """Civic-specific orchestration wrapper"""
@@ -39,16 +43,20 @@ class CivicOrchestrator:
             # 4. Execute parallel (THIS IS asyncio.gather UNDER THE HOOD)
             result = await self.coordinator.execute_parallel()
             
-            # 5. Record metrics
-            for agent_name, metrics in self.coordinator.metrics.items():
-                agent_metrics = AgentMetrics(
-                    agent_name=agent_name,
-                    start_time=time.time(),
-                    status='completed',
-                    input_size=0,
-                    output_size=len(str(result.get(agent_name, {})))
+            # 5. Record per-agent outcomes into the cross-job dashboard
+            for agent_name, state in self.job_context.agent_state.items():
+                agent_metrics = global_metrics.start_agent(agent_name)
+                if state.timestamp_start:
+                    agent_metrics.start_time = state.timestamp_start
+                global_metrics.end_agent(
+                    agent_name,
+                    # Compare by value: the dual package/flat import of
+                    # job_context means state.status may come from the
+                    # other AgentStatus copy, where member == is False
+                    success=state.status.value == AgentStatus.COMPLETED.value,
+                    error_msg=state.error,
+                    result=state.result
                 )
-                global_metrics.record_agent_execution(agent_name, agent_metrics)
             
             return result
         
@@ -120,4 +128,6 @@ async def main():
     return result
 
 if __name__ == '__main__':
+    if uvloop is not None:
+        uvloop.install()
     asyncio.run(main())
@@ -6,55 +6,70 @@ Generates sample data: 5 companies, 20 contracts, 10 incidents
 
 from faker import Faker
 import json
-import random
 from datetime import datetime, timedelta
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 fake = Faker(['uk_UA', 'en_US'])
+# Single generator: categorical and numeric fields are drawn in one
+# vectorized call per batch instead of a Python-level RNG call per row
+rng = np.random.default_rng()
 
 def generate_companies(count=5):
     """Generate fake company records"""
-    companies = []
-    for i in range(count):
-        companies.append({
+    statuses = rng.choice(["active", "pending", "inactive"], size=count).tolist()
+    return [
+        {
             "id": f"company_{i+1}",
             "name": fake.company(),
             "registration_number": fake.bban(),
             "address": fake.address(),
             "created_at": fake.date_time_this_year().isoformat(),
-            "status": random.choice(["active", "pending", "inactive"])
-        })
-    return companies
+            "status": statuses[i]
+        }
+        for i in range(count)
+    ]
 
 def generate_contracts(companies, count=20):
     """Generate fake contract records linked to companies"""
-    contracts = []
-    for i in range(count):
-        company = random.choice(companies)
-        contracts.append({
+    company_indexes = rng.integers(0, len(companies), size=count).tolist()
+    amounts = np.round(rng.uniform(50000, 5000000, count), 2).tolist()
+    statuses = rng.choice(["signed", "pending", "completed"], size=count).tolist()
+    return [
+        {
             "id": f"contract_{i+1}",
-            "company_id": company["id"],
-            "amount_uah": round(random.uniform(50000, 5000000), 2),
+            "company_id": companies[company_indexes[i]]["id"],
+            "amount_uah": amounts[i],
             "signing_date": fake.date_this_year().isoformat(),
             "contractor_name": fake.name(),
             "description": fake.sentence(nb_words=8),
-            "status": random.choice(["signed", "pending", "completed"])
-        })
-    return contracts
+            "status": statuses[i]
+        }
+        for i in range(count)
+    ]
 
 def generate_incidents(count=10):
     """Generate fake incident reports"""
-    incidents = []
     incident_types = ["audit_discrepancy", "fraud_alert", "compliance_violation", "data_breach", "procurement_issue"]
-    for i in range(count):
-        incidents.append({
+    types = rng.choice(incident_types, size=count).tolist()
+    severities = rng.choice(["low", "medium", "high", "critical"], size=count).tolist()
+    statuses = rng.choice(["open", "investigating", "resolved"], size=count).tolist()
+    return [
+        {
             "id": f"incident_{i+1}",
-            "type": random.choice(incident_types),
+            "type": types[i],
             "description": fake.paragraph(nb_sentences=3),
-            "severity": random.choice(["low", "medium", "high", "critical"]),
+            "severity": severities[i],
             "reported_at": fake.date_time_this_month().isoformat(),
-            "status": random.choice(["open", "investigating", "resolved"])
-        })
-    return incidents
+            "status": statuses[i]
+        }
+        for i in range(count)
+    ]
 
 def main():
     print("[AGENT-C] Generating demo data for Bakhmach city civic platform...")
@@ -77,8 +92,14 @@ def main():
         }
     }
     
-    with open("demo_data.json", "w", encoding="utf-8") as f:
-        json.dump(demo_data, f, ensure_ascii=False, indent=2)
+    if orjson is not None:
+        # orjson serializes straight to UTF-8 bytes in C; skip indentation
+        # so large seed runs don't double the output size and write time
+        with open("demo_data.json", "wb") as f:
+            f.write(orjson.dumps(demo_data))
+    else:
+        with open("demo_data.json", "w", encoding="utf-8") as f:
+            json.dump(demo_data, f, ensure_ascii=False, indent=2)
     
     print(f"✅ Demo data generated: {len(companies)} companies, {len(contracts)} contracts, {len(incidents)} incidents")
     print(f"📁 Saved to: demo_data.json")
@@ -3,6 +3,10 @@
 
 import asyncio
 import logging
+import operator
+import re
+import time
+from collections import deque
 from typing import Any, Dict, List, Optional
 from dataclasses import dataclass
 from datetime import datetime
@@ -11,6 +15,12 @@ import json
 
 logger = logging.getLogger(__name__)
 
+# Matches ${var} placeholders anywhere inside a string value
+_VAR_RE = re.compile(r'\$\{([^}]+)\}')
+
+# Supported threshold comparators, e.g. "> 0.8" / "< 100"
+_THRESHOLD_OPS = {'>': operator.gt, '<': operator.lt}
+
 class ExecutionStatus(Enum):
     """Status of workflow execution."""
     PENDING = "pending"
@@ -28,6 +38,13 @@ class StepStatus(Enum):
     FAILED = "failed"
     SKIPPED = "skipped"
 
+# Status strings hoisted out of the hot paths: the per-step serialization
+# loop and the playbook result skip the enum attribute descent per use
+_EXEC_RUNNING = ExecutionStatus.RUNNING.value
+_EXEC_SUCCESS = ExecutionStatus.SUCCESS.value
+_EXEC_FAILED = ExecutionStatus.FAILED.value
+_STEP_STATUS_VALUES = {status: status.value for status in StepStatus}
+
 @dataclass
 class ExecutionContext:
     """Context for workflow execution."""
@@ -49,7 +66,7 @@ class StepResult:
     """Result of step execution."""
     step_id: str
     status: StepStatus
-    output: Optional[Dict[str, Any]] = None
+    output: Optional[Any] = None
     error: Optional[str] = None
     duration_ms: int = 0
 
@@ -77,101 +94,126 @@ class WorkflowEngine:
         execution_result = {
             'execution_id': execution_id,
             'playbook_id': playbook['id'],
-            'status': ExecutionStatus.RUNNING.value,
+            'status': _EXEC_RUNNING,
             'steps': [],
             'started_at': context.started_at.isoformat(),
             'completed_at': None
         }
-        
+        # Collected as StepResult dataclasses during the run; converted to
+        # dicts once at the end instead of one dict build per step
+        step_results: List[StepResult] = []
+
+
         try:
             steps = playbook.get('steps', [])
             dependency_graph = self._build_dependency_graph(steps)
-            
-            for step in dependency_graph.topological_sort():
-                step_result = await self._execute_step(step, context)
-                execution_result['steps'].append({
-                    'step_id': step['id'],
-                    'status': step_result.status.value,
-                    'output': step_result.output,
-                    'error': step_result.error,
-                    'duration_ms': step_result.duration_ms
-                })
-                
-                if step_result.status == StepStatus.FAILED:
-                    if playbook.get('errorHandling') == 'abort':
-                        raise Exception(f"Step failed: {step_result.error}")
-            
-            execution_result['status'] = ExecutionStatus.SUCCESS.value
-            
+
+            # Resolve every referenced connector once up front: steps skip
+            # the registry lookup, and a missing connector fails the
+            # playbook before any step has run
+            connectors: Dict[str, Any] = {}
+            for step in steps:
+                connector_name = step.get('connector')
+                if connector_name and connector_name not in connectors:
+                    connector = self.connector_registry.get(connector_name)
+                    if not connector:
+                        raise ValueError(f"Connector not found: {connector_name}")
+                    connectors[connector_name] = connector
+
+            # Steps within a level have no dependencies on each other, so
+            # their I/O runs concurrently; levels stay ordered
+            for level in dependency_graph.levels():
+                level_results = await asyncio.gather(
+                    *(self._execute_step(step, context, connectors) for step in level)
+                )
+                step_results.extend(level_results)
+
+                failed_result = next(
+                    (r for r in level_results if r.status == StepStatus.FAILED),
+                    None
+                )
+                if failed_result and playbook.get('errorHandling') == 'abort':
+                    raise Exception(f"Step failed: {failed_result.error}")
+
+            execution_result['status'] = _EXEC_SUCCESS
+
         except Exception as e:
-            execution_result['status'] = ExecutionStatus.FAILED.value
+            execution_result['status'] = _EXEC_FAILED
             execution_result['error'] = str(e)
             self.logger.error(f"Playbook execution failed: {e}")
-        
+
         finally:
             execution_result['completed_at'] = datetime.utcnow().isoformat()
-        
+            execution_result['steps'] = [
+                {
+                    'step_id': r.step_id,
+                    'status': _STEP_STATUS_VALUES[r.status],
+                    'output': r.output,
+                    'error': r.error,
+                    'duration_ms': r.duration_ms
+                }
+                for r in step_results
+            ]
+
         return execution_result
     
     async def _execute_step(
         self,
         step: Dict[str, Any],
-        context: ExecutionContext
+        context: ExecutionContext,
+        connectors: Dict[str, Any]
     ) -> StepResult:
         """Execute individual workflow step."""
         step_id = step['id']
-        start_time = datetime.utcnow()
-        
+        # Monotonic ns counter: no datetime allocation per step and immune
+        # to wall-clock jumps
+        start_ns = time.perf_counter_ns()
+
         try:
             action = step.get('action')
             connector_name = step.get('connector')
             config = step.get('config', {})
-            
+
             if action == 'query':
-                result = await self._execute_query_step(connector_name, config, context)
+                result = await self._execute_query_step(connectors[connector_name], config, context)
             elif action == 'evaluate':
                 result = await self._execute_evaluate_step(config, context)
             elif action == 'template':
                 result = await self._execute_template_step(config, context)
             elif action == 'communicate':
-                result = await self._execute_communicate_step(connector_name, config, context)
+                result = await self._execute_communicate_step(connectors[connector_name], config, context)
             else:
                 raise ValueError(f"Unknown action: {action}")
             
-            duration = (datetime.utcnow() - start_time).total_seconds() * 1000
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
             return StepResult(
                 step_id=step_id,
                 status=StepStatus.SUCCESS,
                 output=result,
-                duration_ms=int(duration)
+                duration_ms=duration_ms
             )
-        
+
         except Exception as e:
-            duration = (datetime.utcnow() - start_time).total_seconds() * 1000
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
             self.logger.error(f"Step {step_id} failed: {e}")
             return StepResult(
                 step_id=step_id,
                 status=StepStatus.FAILED,
                 error=str(e),
-                duration_ms=int(duration)
+                duration_ms=duration_ms
             )
     
     async def _execute_query_step(
         self,
-        connector_name: str,
+        connector: Any,
         config: Dict[str, Any],
         context: ExecutionContext
-    ) -> Dict[str, Any]:
-        """Execute query step."""
-        connector = self.connector_registry.get(connector_name)
-        if not connector:
-            raise ValueError(f"Connector not found: {connector_name}")
-        
+    ) -> Any:
+        """Execute query step, returning the connector result directly."""
         query = config.get('query')
         params = self._interpolate_variables(config.get('params', {}), context)
-        
-        result = await connector.execute_query(query, params)
-        return {'data': result}
+
+        return await connector.execute_query(query, params)
     
     async def _execute_evaluate_step(
         self,
@@ -180,13 +222,13 @@ class WorkflowEngine:
     ) -> Dict[str, Any]:
         """Execute evaluation step."""
         criteria = config.get('criteria', [])
-        passed = True
-        
-        for criterion in criteria:
-            metric = criterion.get('metric')
-            threshold = criterion.get('threshold')
-            passed = passed and self._evaluate_criterion(metric, threshold, context)
-        
+        # Parse thresholds into (metric, comparator, target) once, then
+        # evaluate; all() still stops at the first failing criterion
+        parsed = [self._parse_criterion(c) for c in criteria]
+        passed = all(
+            self._evaluate_criterion(metric, op, target, context)
+            for metric, op, target in parsed
+        )
         return {'passed': passed}
     
     async def _execute_template_step(
@@ -207,20 +249,16 @@ class WorkflowEngine:
     
     async def _execute_communicate_step(
         self,
-        connector_name: str,
+        connector: Any,
         config: Dict[str, Any],
         context: ExecutionContext
-    ) -> Dict[str, Any]:
-        """Execute communication step."""
-        connector = self.connector_registry.get(connector_name)
-        if not connector:
-            raise ValueError(f"Connector not found: {connector_name}")
-        
+    ) -> int:
+        """Execute communication step, returning the sent-message count."""
         recipients = config.get('recipients', [])
         template = config.get('template')
-        
+
         result = await connector.send_message(recipients, template, context.variables)
-        return {'sent_count': len(result)}
+        return len(result)
     
     def _build_dependency_graph(self, steps: List[Dict[str, Any]]) -> 'DependencyGraph':
         """Build dependency graph for steps."""
@@ -231,36 +269,50 @@ class WorkflowEngine:
         data: Dict[str, Any],
         context: ExecutionContext
     ) -> Dict[str, Any]:
-        """Interpolate variables in data."""
+        """Interpolate ${var} placeholders in string values.
+
+        A value that is exactly one placeholder keeps the variable's raw
+        type; embedded placeholders are substituted in a single regex pass.
+        """
         result = {}
         for key, value in data.items():
-            if isinstance(value, str) and value.startswith('${'):
-                var_name = value[2:-1]
-                result[key] = context.get_variable(var_name)
+            if isinstance(value, str):
+                match = _VAR_RE.fullmatch(value)
+                if match:
+                    result[key] = context.get_variable(match.group(1))
+                else:
+                    result[key] = _VAR_RE.sub(
+                        lambda m: str(context.get_variable(m.group(1))),
+                        value
+                    )
             else:
                 result[key] = value
         return result
     
+    def _parse_criterion(self, criterion: Dict[str, Any]) -> tuple:
+        """Parse a criterion into (metric, comparator, target) once.
+
+        Unrecognized thresholds parse to a None comparator, which always
+        evaluates False — matching the previous behavior.
+        """
+        threshold = criterion.get('threshold') or ''
+        for symbol, op in _THRESHOLD_OPS.items():
+            if symbol in threshold:
+                return criterion.get('metric'), op, float(threshold.split(symbol)[-1])
+        return criterion.get('metric'), None, None
+
     def _evaluate_criterion(
         self,
         metric: str,
-        threshold: str,
+        op: Optional[Any],
+        target: Optional[float],
         context: ExecutionContext
     ) -> bool:
-        """Evaluate criterion."""
+        """Evaluate a pre-parsed criterion."""
         value = context.get_variable(metric)
-        if value is None:
+        if value is None or op is None:
             return False
-        
-        # Simple evaluation - can be extended
-        if '>' in threshold:
-            target = float(threshold.split('>')[-1])
-            return value > target
-        elif '<' in threshold:
-            target = float(threshold.split('<')[-1])
-            return value < target
-        
-        return False
+        return op(value, target)
 
 class DependencyGraph:
     """Manages dependencies between workflow steps."""
@@ -275,22 +327,63 @@ class DependencyGraph:
         adj = {step['id']: step.get('dependencies', []) for step in steps}
         return adj
     
+    def _child_map(self) -> Dict[str, List[str]]:
+        """Reverse adjacency: step id -> ids of steps depending on it."""
+        children: Dict[str, List[str]] = {step_id: [] for step_id in self.steps}
+        for step_id, deps in self.adjacency.items():
+            for dep_id in deps:
+                if dep_id in children:
+                    children[dep_id].append(step_id)
+        return children
+
+    def levels(self) -> List[List[Dict[str, Any]]]:
+        """Group steps into dependency levels via Kahn's algorithm.
+
+        Steps within one level are mutually independent and safe to run
+        concurrently; each level only depends on earlier levels.
+        """
+        indegree = {step_id: len(deps) for step_id, deps in self.adjacency.items()}
+        children = self._child_map()
+
+        current = [step_id for step_id, degree in indegree.items() if degree == 0]
+        result = []
+        emitted = 0
+
+        while current:
+            result.append([self.steps[step_id] for step_id in current])
+            emitted += len(current)
+            next_level = []
+            for step_id in current:
+                for child_id in children[step_id]:
+                    indegree[child_id] -= 1
+                    if indegree[child_id] == 0:
+                        next_level.append(child_id)
+            current = next_level
+
+        if emitted != len(self.steps):
+            raise ValueError("Cycle detected in workflow step dependencies")
+        return result
+
     def topological_sort(self) -> List[Dict[str, Any]]:
-        """Return steps in topological order."""
-        visited = set()
+        """Return steps in topological order (iterative Kahn's algorithm).
+
+        No recursion, so deep DAGs neither pay per-node frame setup nor
+        risk RecursionError.
+        """
+        indegree = {step_id: len(deps) for step_id, deps in self.adjacency.items()}
+        children = self._child_map()
+
+        queue = deque(step_id for step_id, degree in indegree.items() if degree == 0)
         result = []
-        
-        def visit(step_id: str) -> None:
-            if step_id in visited:
-                return
-            visited.add(step_id)
-            
-            for dep_id in self.adjacency.get(step_id, []):
-                visit(dep_id)
-            
+
+        while queue:
+            step_id = queue.popleft()
             result.append(self.steps[step_id])
-        
-        for step_id in self.steps:
-            visit(step_id)
-        
+            for child_id in children[step_id]:
+                indegree[child_id] -= 1
+                if indegree[child_id] == 0:
+                    queue.append(child_id)
+
+        if len(result) != len(self.steps):
+            raise ValueError("Cycle detected in workflow step dependencies")
         return result
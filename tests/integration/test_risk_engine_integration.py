@@ -7,12 +7,14 @@ Test the full MVP pipeline:
 Demo Data (seeds_demo.py output) → Risk Engine (Audityzer) → Risk API (MFO-Shield)
 """
 
-import requests
+import asyncio
 import json
 from typing import Dict, Any, List
 from dataclasses import dataclass
 from datetime import datetime
 
+import aiohttp
+
 # Constants
 RISK_API_BASE_URL = "http://localhost:5000"
 RISK_ENGINE_MOCK_DATA = {
@@ -66,48 +68,60 @@ class IntegrationTester:
         self.api_url = api_base_url
         self.results: List[RiskAssessmentResult] = []
         self.errors: List[Dict[str, Any]] = []
+        # One ISO timestamp per run, reused across error entries instead of
+        # re-formatting datetime.utcnow() on every failure
+        self.run_started_at: str = ""
     
-    def test_health_check(self) -> bool:
+    async def test_health_check(self, session: aiohttp.ClientSession) -> bool:
         """Test that the Risk API is healthy"""
         print("\n[TEST] Health Check")
         print(f"  Endpoint: GET {self.api_url}/health")
         try:
-            response = requests.get(f"{self.api_url}/health", timeout=5)
-            print(f"  Status: {response.status_code}")
-            print(f"  Response: {response.json()}")
-            return response.status_code == 200
+            async with session.get(f"{self.api_url}/health", timeout=aiohttp.ClientTimeout(total=5)) as response:
+                body = await response.json()
+                print(f"  Status: {response.status}")
+                print(f"  Response: {body}")
+                return response.status == 200
         except Exception as e:
             print(f"  ERROR: {str(e)}")
             self.errors.append({
                 'test': 'health_check',
                 'error': str(e),
-                'timestamp': datetime.utcnow().isoformat()
+                'timestamp': self.run_started_at
             })
             return False
-    
-    def test_risk_assessment(self, subject_id: str, subject_data: Dict[str, Any]) -> bool:
+
+    async def test_risk_assessment(
+        self,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+        subject_id: str,
+        subject_data: Dict[str, Any]
+    ) -> bool:
         """Test risk assessment for a subject"""
         print(f"\n[TEST] Risk Assessment: {subject_id}")
         print(f"  Input Data: {subject_data}")
         try:
-            response = requests.post(
-                f"{self.api_url}/subjects/{subject_id}/risk",
-                json=subject_data,
-                timeout=5
-            )
-            print(f"  Status: {response.status_code}")
-            result = response.json()
+            async with semaphore:
+                async with session.post(
+                    f"{self.api_url}/subjects/{subject_id}/risk",
+                    json=subject_data,
+                    timeout=aiohttp.ClientTimeout(total=5)
+                ) as response:
+                    status = response.status
+                    result = await response.json()
+            print(f"  Status: {status}")
             print(f"  Risk Score: {result.get('risk_score')}")
             print(f"  Risk Level: {result.get('risk_level')}")
-            
-            if response.status_code == 200:
+
+            if status == 200:
                 self.results.append(RiskAssessmentResult(subject_id, result))
                 return True
             else:
                 self.errors.append({
                     'test': f'risk_assessment_{subject_id}',
                     'error': result.get('error', 'Unknown error'),
-                    'status_code': response.status_code
+                    'status_code': status
                 })
                 return False
         except Exception as e:
@@ -115,31 +129,38 @@ class IntegrationTester:
             self.errors.append({
                 'test': f'risk_assessment_{subject_id}',
                 'error': str(e),
-                'timestamp': datetime.utcnow().isoformat()
+                'timestamp': self.run_started_at
             })
             return False
-    
-    def run_full_pipeline_test(self) -> Dict[str, Any]:
+
+    async def run_full_pipeline_test(self) -> Dict[str, Any]:
         """Run the full MVP pipeline test"""
+        self.run_started_at = datetime.utcnow().isoformat()
         print("\n" + "="*60)
         print("RISK ENGINE + MFO RISK API INTEGRATION TEST")
-        print(f"Start Time: {datetime.utcnow().isoformat()}")
+        print(f"Start Time: {self.run_started_at}")
         print("="*60)
-        
-        # Test 1: Health check
-        health_ok = self.test_health_check()
-        if not health_ok:
-            print("\n[FATAL] Risk API is not responding. Cannot proceed with tests.")
-            return self._generate_report()
-        
-        # Test 2: Risk assessments for each company
-        passed_tests = 0
-        for company_id, company_data in RISK_ENGINE_MOCK_DATA.items():
-            if self.test_risk_assessment(company_id, company_data):
-                passed_tests += 1
-        
+
+        # One pooled keep-alive session for the whole run; assessments fan
+        # out concurrently with a semaphore capping in-flight requests
+        connector = aiohttp.TCPConnector(limit=10)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            # Test 1: Health check
+            health_ok = await self.test_health_check(session)
+            if not health_ok:
+                print("\n[FATAL] Risk API is not responding. Cannot proceed with tests.")
+                return self._generate_report()
+
+            # Test 2: Risk assessments for each company, in parallel
+            semaphore = asyncio.Semaphore(5)
+            outcomes = await asyncio.gather(*(
+                self.test_risk_assessment(session, semaphore, company_id, company_data)
+                for company_id, company_data in RISK_ENGINE_MOCK_DATA.items()
+            ))
+        passed_tests = sum(outcomes)
+
         print(f"\n[SUMMARY] Passed {passed_tests}/{len(RISK_ENGINE_MOCK_DATA)} risk assessments")
-        
+
         return self._generate_report()
     
     def _generate_report(self) -> Dict[str, Any]:
@@ -189,7 +210,7 @@ if __name__ == "__main__":
     print(f"Target API: {RISK_API_BASE_URL}")
     
     tester = IntegrationTester(RISK_API_BASE_URL)
-    report = tester.run_full_pipeline_test()
+    report = asyncio.run(tester.run_full_pipeline_test())
     tester.print_report(report)
     
     # Exit with appropriate code